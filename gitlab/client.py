@@ -16,10 +16,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Wrapper for the GitLab API."""
 
+import copy
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, cast, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import requests
+import requests.adapters
 import requests.utils
 from requests_toolbelt.multipart.encoder import MultipartEncoder  # type: ignore
 
@@ -28,12 +32,33 @@ import gitlab.const
 import gitlab.exceptions
 from gitlab import utils
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 REDIRECT_MSG = (
     "python-gitlab detected a {status_code} ({reason!r}) redirection. You must update "
     "your GitLab URL to the correct URL to avoid issues. The redirection was from: "
     "{source!r} to {target!r}"
 )
 
+# Size of the connection pool mounted on sessions created by python-gitlab.
+# requests defaults to 10 connections per host, which forces threaded scripts
+# to open (and TLS-handshake) new connections once more requests are in flight.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Maximum number of objects kept in the get() cache (see Gitlab.cache_ttl)
+CACHE_MAXSIZE = 4096
+
+
+def _json_loads(result: requests.Response) -> Any:
+    # orjson is an optional, faster drop-in for decoding the response bodies
+    if orjson is None:
+        return result.json()
+    return orjson.loads(result.content)
+
 
 class Gitlab(object):
     """Represents a GitLab server connection.
@@ -55,6 +80,9 @@ class Gitlab(object):
         user_agent (str): A custom user agent to use for making HTTP requests.
         retry_transient_errors (bool): Whether to retry after 500, 502, 503, or
             504 responses. Defaults to False.
+        cache_ttl (float): How long, in seconds, the objects retrieved with
+            get() on managers supporting it are cached. Defaults to None
+            (no caching).
     """
 
     def __init__(
@@ -74,6 +102,7 @@ class Gitlab(object):
         order_by: Optional[str] = None,
         user_agent: str = gitlab.const.USER_AGENT,
         retry_transient_errors: bool = False,
+        cache_ttl: Optional[float] = None,
     ) -> None:
 
         self._api_version = str(api_version)
@@ -84,6 +113,10 @@ class Gitlab(object):
         #: Timeout to use for requests to gitlab server
         self.timeout = timeout
         self.retry_transient_errors = retry_transient_errors
+        #: Lifetime of the cached get() results, in seconds
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Any, Tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
         #: Headers that will be used in request to GitLab
         self.headers = {"User-Agent": user_agent}
 
@@ -98,7 +131,7 @@ class Gitlab(object):
         self._set_auth_info()
 
         #: Create a session object for requests
-        self.session = session or requests.Session()
+        self.session = session or self._create_session()
 
         self.per_page = per_page
         self.pagination = pagination
@@ -190,10 +223,16 @@ class Gitlab(object):
     def __getstate__(self) -> Dict[str, Any]:
         state = self.__dict__.copy()
         state.pop("_objects")
+        # Cached entries hold monotonic clock deadlines, which are meaningless
+        # in another process
+        state.pop("_cache")
+        state.pop("_cache_lock")
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         self.__dict__.update(state)
+        self._cache = {}
+        self._cache_lock = threading.Lock()
         # We only support v4 API at this time
         if self._api_version not in ("4",):
             raise ModuleNotFoundError(name="gitlab.v%s.objects" % self._api_version)
@@ -434,6 +473,43 @@ class Gitlab(object):
         requests_log.setLevel(logging.DEBUG)
         requests_log.propagate = True
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _cache_get(self, key: Any) -> Optional[Dict[str, Any]]:
+        with self._cache_lock:
+            try:
+                expires, data = self._cache[key]
+            except KeyError:
+                return None
+            if expires < time.monotonic():
+                del self._cache[key]
+                return None
+        return copy.deepcopy(data)
+
+    def _cache_set(self, key: Any, data: Dict[str, Any]) -> None:
+        if not self.cache_ttl:
+            return
+        expires = time.monotonic() + self.cache_ttl
+        data = copy.deepcopy(data)
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= CACHE_MAXSIZE:
+                # Evict the oldest entry
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (expires, data)
+
+    def clear_cache(self) -> None:
+        """Drop all the cached get() results."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def _get_session_opts(self) -> Dict[str, Any]:
         return {
             "headers": self.headers.copy(),
@@ -614,6 +690,9 @@ class Gitlab(object):
             self._check_redirects(result)
 
             if 200 <= result.status_code < 300:
+                if verb.lower() != "get":
+                    # Any write may modify cached resources
+                    self.clear_cache()
                 return result
 
             retry_transient_errors = kwargs.get(
@@ -632,7 +711,7 @@ class Gitlab(object):
 
             error_message = result.content
             try:
-                error_json = result.json()
+                error_json = _json_loads(result)
                 for k in ("message", "error"):
                     if k in error_json:
                         error_message = error_json[k]
@@ -690,7 +769,7 @@ class Gitlab(object):
             and not raw
         ):
             try:
-                return result.json()
+                return _json_loads(result)
             except Exception as e:
                 raise gitlab.exceptions.GitlabParsingError(
                     error_message="Failed to parse the server message"
@@ -703,6 +782,7 @@ class Gitlab(object):
         path: str,
         query_data: Optional[Dict[str, Any]] = None,
         as_list: Optional[bool] = None,
+        max_workers: Optional[int] = None,
         **kwargs: Any,
     ) -> Union["GitlabList", List[Dict[str, Any]]]:
         """Make a GET request to the Gitlab server for list-oriented queries.
@@ -711,6 +791,8 @@ class Gitlab(object):
             path (str): Path or full URL to query ('/projects' or
                         'http://whatever/v4/api/projects')
             query_data (dict): Data to send as query parameters
+            max_workers (int): When `all` is True, fetch the remaining pages
+                               concurrently using up to this many threads
             **kwargs: Extra options to send to the server (e.g. sudo, page,
                       per_page)
 
@@ -736,6 +818,10 @@ class Gitlab(object):
         page = kwargs.get("page")
 
         if get_all is True and as_list is True:
+            if max_workers and not page:
+                return self._list_all_concurrently(
+                    url, query_data, max_workers, **kwargs
+                )
             return list(GitlabList(self, url, query_data, **kwargs))
 
         if page or as_list is True:
@@ -745,6 +831,28 @@ class Gitlab(object):
         # No pagination, generator requested
         return GitlabList(self, url, query_data, **kwargs)
 
+    def _list_all_concurrently(
+        self, url: str, query_data: Dict[str, Any], max_workers: int, **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        first_page = GitlabList(self, url, query_data, **kwargs)
+        # Keyset pagination and very large collections don't report the total
+        # number of pages: follow the `next` links sequentially instead.
+        if not first_page._total_pages or not first_page._next_page:
+            return list(first_page)
+
+        def get_page(page: int) -> List[Dict[str, Any]]:
+            return list(
+                GitlabList(self, url, query_data, get_next=False, page=page, **kwargs)
+            )
+
+        first = first_page.current_page + 1
+        pages = range(first, first_page.total_pages + 1)
+        items = list(first_page._data)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for page_items in executor.map(get_page, pages):
+                items.extend(page_items)
+        return items
+
     def http_post(
         self,
         path: str,
@@ -787,7 +895,7 @@ class Gitlab(object):
         )
         try:
             if result.headers.get("Content-Type", None) == "application/json":
-                return result.json()
+                return _json_loads(result)
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
@@ -835,7 +943,7 @@ class Gitlab(object):
             **kwargs,
         )
         try:
-            return result.json()
+            return _json_loads(result)
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
@@ -931,7 +1039,7 @@ class GitlabList(object):
         self._total: Optional[Union[str, int]] = result.headers.get("X-Total")
 
         try:
-            self._data: List[Dict[str, Any]] = result.json()
+            self._data: List[Dict[str, Any]] = _json_loads(result)
         except Exception as e:
             raise gitlab.exceptions.GitlabParsingError(
                 error_message="Failed to parse the server message"
@@ -38,6 +38,7 @@ from gitlab import utils
 
 __all__ = [
     "GetMixin",
+    "CachedGetMixin",
     "GetWithoutIdMixin",
     "RefreshMixin",
     "ListMixin",
@@ -114,6 +115,33 @@ class GetMixin(_RestManagerBase):
         return self._obj_cls(self, server_data)
 
 
+class CachedGetMixin(GetMixin):
+    """Cache the objects retrieved with get() for ``gitlab.cache_ttl`` seconds.
+
+    Caching is disabled unless ``cache_ttl`` is set on the Gitlab object. The
+    cache is cleared by every successful POST, PUT or DELETE request.
+    """
+
+    def get(
+        self, id: Union[str, int], lazy: bool = False, **kwargs: Any
+    ) -> base.RESTObject:
+        if lazy is True or not self.gitlab.cache_ttl:
+            return super().get(id, lazy=lazy, **kwargs)
+        try:
+            key = (self.path, id, frozenset(kwargs.items()))
+            server_data = self.gitlab._cache_get(key)
+        except TypeError:
+            # Unhashable query parameters, don't cache
+            return super().get(id, **kwargs)
+        if TYPE_CHECKING:
+            assert self._obj_cls is not None
+        if server_data is not None:
+            return self._obj_cls(self, server_data)
+        obj = super().get(id, **kwargs)
+        self.gitlab._cache_set(key, obj._attrs)
+        return obj
+
+
 class GetWithoutIdMixin(_RestManagerBase):
     _computed_path: Optional[str]
     _from_parent_attrs: Dict[str, Any]
@@ -204,6 +232,8 @@ class ListMixin(_RestManagerBase):
             page (int): ID of the page to return (starts with page 1)
             as_list (bool): If set to False and no pagination option is
                 defined, return a generator instead of a list
+            max_workers (int): If `all` is True, fetch the pages concurrently
+                using up to this many threads
             **kwargs: Extra options to send to the server (e.g. sudo)
 
         Returns:
@@ -1,7 +1,15 @@
+import re
+
 from gitlab import cli
 from gitlab import exceptions as exc
 from gitlab.base import RESTManager, RESTObject
-from gitlab.mixins import DeleteMixin, ListMixin, ObjectDeleteMixin, RetrieveMixin
+from gitlab.mixins import (
+    CachedGetMixin,
+    DeleteMixin,
+    ListMixin,
+    ObjectDeleteMixin,
+    RetrieveMixin,
+)
 
 __all__ = [
     "ProjectRegistryRepository",
@@ -10,6 +18,9 @@ __all__ = [
     "ProjectRegistryTagManager",
 ]
 
+# Optional parameters accepted by the bulk tag deletion endpoint
+_BULK_DELETE_ATTRS = frozenset(("keep_n", "name_regex_keep", "older_than"))
+
 
 class ProjectRegistryRepository(ObjectDeleteMixin, RESTObject):
     tags: "ProjectRegistryTagManager"
@@ -25,7 +36,9 @@ class ProjectRegistryTag(ObjectDeleteMixin, RESTObject):
     _id_attr = "name"
 
 
-class ProjectRegistryTagManager(DeleteMixin, RetrieveMixin, RESTManager):
+class ProjectRegistryTagManager(
+    CachedGetMixin, DeleteMixin, RetrieveMixin, RESTManager
+):
     _obj_cls = ProjectRegistryTag
     _from_parent_attrs = {"project_id": "project_id", "repository_id": "id"}
     _path = "/projects/%(project_id)s/registry/repositories/%(repository_id)s/tags"
@@ -50,7 +63,34 @@ class ProjectRegistryTagManager(DeleteMixin, RetrieveMixin, RESTManager):
             GitlabAuthenticationError: If authentication is not correct
             GitlabDeleteError: If the server cannot perform the request
         """
-        valid_attrs = ["keep_n", "name_regex_keep", "older_than"]
         data = {"name_regex": name_regex}
-        data.update({k: v for k, v in kwargs.items() if k in valid_attrs})
+        data.update({k: kwargs[k] for k in kwargs.keys() & _BULK_DELETE_ATTRS})
         self.gitlab.http_delete(self.path, query_data=data, **kwargs)
+
+    def delete_many(self, names, **kwargs):
+        """Schedule the deletion of several tags by name in a single request.
+
+        The names are escaped and combined into one ``name_regex`` passed to
+        :meth:`delete_in_bulk`. This goes through the bulk deletion API,
+        which behaves differently from deleting tags one by one:
+
+        * the server only schedules a background job, so the tags are
+          deleted asynchronously, after this method returns;
+        * GitLab accepts at most one bulk deletion per hour and per
+          repository, so this fails if another one ran recently;
+        * the ``latest`` tag is never deleted, even if listed in ``names``.
+
+        Use :meth:`delete` on each tag if these limits are a problem.
+
+        Args:
+            names (list): The names of the tags to delete
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Raises:
+            GitlabAuthenticationError: If authentication is not correct
+            GitlabDeleteError: If the server cannot perform the request
+        """
+        if not names:
+            return
+        name_regex = "(?:%s)" % "|".join(re.escape(name) for name in names)
+        self.delete_in_bulk(name_regex=name_regex, **kwargs)
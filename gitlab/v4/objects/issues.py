@@ -3,6 +3,7 @@ from gitlab import exceptions as exc
 from gitlab import types
 from gitlab.base import RequiredOptional, RESTManager, RESTObject
 from gitlab.mixins import (
+    CachedGetMixin,
     CreateMixin,
     CRUDMixin,
     DeleteMixin,
@@ -43,7 +44,7 @@ class Issue(RESTObject):
     _short_print_attr = "title"
 
 
-class IssueManager(RetrieveMixin, RESTManager):
+class IssueManager(CachedGetMixin, RetrieveMixin, RESTManager):
     _path = "/issues"
     _obj_cls = Issue
     _list_filters = (
@@ -127,7 +128,7 @@ class ProjectIssue(
             GitlabAuthenticationError: If authentication is not correct
             GitlabUpdateError: If the issue could not be moved
         """
-        path = "%s/%s/move" % (self.manager.path, self.get_id())
+        path = f"{self.manager.path}/{self.get_id()}/move"
         data = {"to_project_id": to_project_id}
         server_data = self.manager.gitlab.http_post(path, post_data=data, **kwargs)
         self._update_attrs(server_data)
@@ -147,7 +148,7 @@ class ProjectIssue(
         Returns:
             list: The list of merge requests.
         """
-        path = "%s/%s/related_merge_requests" % (self.manager.path, self.get_id())
+        path = f"{self.manager.path}/{self.get_id()}/related_merge_requests"
         return self.manager.gitlab.http_get(path, **kwargs)
 
     @cli.register_custom_action("ProjectIssue")
@@ -165,7 +166,7 @@ class ProjectIssue(
         Returns:
             list: The list of merge requests.
         """
-        path = "%s/%s/closed_by" % (self.manager.path, self.get_id())
+        path = f"{self.manager.path}/{self.get_id()}/closed_by"
         return self.manager.gitlab.http_get(path, **kwargs)
 
 
@@ -251,6 +252,46 @@ class ProjectIssueLinkManager(ListMixin, CreateMixin, DeleteMixin, RESTManager):
         """
         self._check_missing_create_attrs(data)
         server_data = self.gitlab.http_post(self.path, post_data=data, **kwargs)
-        source_issue = ProjectIssue(self._parent.manager, server_data["source_issue"])
-        target_issue = ProjectIssue(self._parent.manager, server_data["target_issue"])
+        issue_manager = self._parent.manager
+        source_issue = ProjectIssue(issue_manager, server_data["source_issue"])
+        target_issue = ProjectIssue(issue_manager, server_data["target_issue"])
         return source_issue, target_issue
+
+    def create_many(self, targets, **kwargs):
+        """Link the issue to several other issues.
+
+        The links are created one by one, in order. If one of them fails, the
+        remaining ones are not attempted and the links created before the
+        failure are left in place on the server.
+
+        Args:
+            targets (list): (target_project_id, target_issue_iid) pairs
+                            identifying the issues to link to
+            **kwargs: Extra options to send to the server (e.g. sudo)
+
+        Returns:
+            list: The (source, target) issues pairs, one per link created
+
+        Raises:
+            GitlabAuthenticationError: If authentication is not correct
+            GitlabCreateError: If a link cannot be created. The exception
+                               ``failed_target`` attribute holds the pair that
+                               failed, and ``created_links`` the (source,
+                               target) pairs of the links created before it.
+        """
+        links = []
+        for project_id, issue_iid in targets:
+            data = {"target_project_id": project_id, "target_issue_iid": issue_iid}
+            try:
+                links.append(self.create(data, **kwargs))
+            except exc.GitlabCreateError as e:
+                error = exc.GitlabCreateError(
+                    "Failed to link issue %s#%s: %s"
+                    % (project_id, issue_iid, e.error_message),
+                    response_code=e.response_code,
+                    response_body=e.response_body,
+                )
+                error.failed_target = (project_id, issue_iid)
+                error.created_links = links
+                raise error from e
+        return links
@@ -48,6 +48,7 @@ setup(
     ],
     extras_require={
         "autocompletion": ["argcomplete>=1.10.0,<2"],
+        "orjson": ["orjson>=3.0"],
         "yaml": ["PyYaml>=5.2"],
     },
 )
@@ -1,14 +1,19 @@
 """
 GitLab API: https://docs.gitlab.com/ce/api/issues.html
 """
+import json
 import re
 
 import pytest
 import responses
 
+from gitlab.base import RESTObjectList
+from gitlab.exceptions import GitlabCreateError
 from gitlab.v4.objects import (
     GroupIssuesStatistics,
+    Issue,
     IssuesStatistics,
+    ProjectIssue,
     ProjectIssuesStatistics,
 )
 
@@ -41,6 +46,52 @@ def resp_get_issue():
         yield rsps
 
 
+@pytest.fixture
+def resp_issue_actions():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/issues/1/move",
+            json={"iid": 3, "project_id": 2},
+            content_type="application/json",
+            status=201,
+        )
+        rsps.add(
+            method=responses.GET,
+            url=re.compile(
+                r"http://localhost/api/v4/projects/1/issues/1/"
+                r"(related_merge_requests|closed_by)"
+            ),
+            json=[{"iid": 1, "title": "mr"}],
+            content_type="application/json",
+            status=200,
+        )
+        yield rsps
+
+
+@pytest.fixture
+def resp_create_issue_links():
+    def request_callback(request):
+        target = json.loads(request.body)
+        content = {
+            "source_issue": {"iid": 1, "project_id": 1},
+            "target_issue": {
+                "iid": target["target_issue_iid"],
+                "project_id": target["target_project_id"],
+            },
+        }
+        return (201, {}, json.dumps(content))
+
+    with responses.RequestsMock() as rsps:
+        rsps.add_callback(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/issues/1/links",
+            callback=request_callback,
+            content_type="application/json",
+        )
+        yield rsps
+
+
 @pytest.fixture
 def resp_issue_statistics():
     content = {"statistics": {"counts": {"all": 20, "closed": 5, "opened": 15}}}
@@ -64,12 +115,111 @@ def test_list_issues(gl, resp_list_issues):
     assert data[1].name == "other_name"
 
 
+def test_list_issues_generator(gl, resp_list_issues):
+    issues = gl.issues.list(as_list=False)
+    assert isinstance(issues, RESTObjectList)
+    issue = next(issues)
+    assert isinstance(issue, Issue)
+    assert issue.id == 1
+    assert [issue.id for issue in issues] == [2]
+
+
 def test_get_issue(gl, resp_get_issue):
     issue = gl.issues.get(1)
     assert issue.id == 1
     assert issue.name == "name"
 
 
+def test_get_issue_cached(gl, resp_get_issue):
+    gl.cache_ttl = 30
+    issue = gl.issues.get(1)
+    issue.name = "updated"
+    assert gl.issues.get(1).name == "name"
+    assert len(resp_get_issue.calls) == 1
+
+    gl.clear_cache()
+    gl.issues.get(1)
+    assert len(resp_get_issue.calls) == 2
+
+
+def test_get_issue_cache_cleared_on_update(gl, project):
+    gl.cache_ttl = 30
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/issues/1",
+            json={"id": 1, "state": "opened"},
+            content_type="application/json",
+            status=200,
+        )
+        rsps.add(
+            method=responses.PUT,
+            url="http://localhost/api/v4/projects/1/issues/1",
+            json={"iid": 1, "state": "closed"},
+            content_type="application/json",
+            status=200,
+        )
+        assert gl.issues.get(1).state == "opened"
+        project.issues.update(1, {"state_event": "close"})
+        rsps.replace(
+            responses.GET,
+            "http://localhost/api/v4/issues/1",
+            json={"id": 1, "state": "closed"},
+            content_type="application/json",
+            status=200,
+        )
+        assert gl.issues.get(1).state == "closed"
+        assert len(rsps.calls) == 3
+
+
+def test_project_issue_actions(project_issue, resp_issue_actions):
+    assert project_issue.related_merge_requests()[0]["title"] == "mr"
+    assert project_issue.closed_by()[0]["iid"] == 1
+    project_issue.move(2)
+    assert project_issue.iid == 3
+    assert project_issue.project_id == 2
+
+
+def test_create_issue_links(project_issue, resp_create_issue_links):
+    links = project_issue.links.create_many([(1, 2), (3, 4)])
+    assert len(resp_create_issue_links.calls) == 2
+    assert [(src.iid, dest.project_id, dest.iid) for src, dest in links] == [
+        (1, 1, 2),
+        (1, 3, 4),
+    ]
+    assert all(isinstance(issue, ProjectIssue) for link in links for issue in link)
+
+
+def test_create_issue_links_failure(project_issue):
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/issues/1/links",
+            json={
+                "source_issue": {"iid": 1, "project_id": 1},
+                "target_issue": {"iid": 2, "project_id": 1},
+            },
+            content_type="application/json",
+            status=201,
+        )
+        rsps.add(
+            method=responses.POST,
+            url="http://localhost/api/v4/projects/1/issues/1/links",
+            json={"message": "Issue(s) already assigned"},
+            content_type="application/json",
+            status=409,
+        )
+        with pytest.raises(GitlabCreateError) as exc_info:
+            project_issue.links.create_many([(1, 2), (3, 4), (5, 6)])
+        assert len(rsps.calls) == 2
+
+    error = exc_info.value
+    assert error.response_code == 409
+    assert "3#4" in error.error_message
+    assert error.failed_target == (3, 4)
+    assert [dest.iid for src, dest in error.created_links] == [2]
+
+
 def test_get_issues_statistics(gl, resp_issue_statistics):
     statistics = gl.issues_statistics.get()
     assert isinstance(statistics, IssuesStatistics)
@@ -0,0 +1,79 @@
+"""
+GitLab API: https://docs.gitlab.com/ce/api/container_registry.html
+"""
+import re
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from gitlab.v4.objects import ProjectRegistryRepository
+
+tags_url = re.compile(
+    r"http://localhost/api/v4/projects/1/registry/repositories/1/tags"
+)
+
+
+@pytest.fixture
+def repository(project):
+    return ProjectRegistryRepository(project.repositories, {"id": 1, "project_id": 1})
+
+
+@pytest.fixture
+def resp_delete_tags_in_bulk():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.DELETE,
+            url=tags_url,
+            status=204,
+        )
+        yield rsps
+
+
+@pytest.fixture
+def resp_get_tag():
+    with responses.RequestsMock() as rsps:
+        rsps.add(
+            method=responses.GET,
+            url="http://localhost/api/v4/projects/1/registry/repositories/1/tags/v1",
+            json={"name": "v1", "digest": "sha256:abc"},
+            content_type="application/json",
+            status=200,
+        )
+        rsps.add(
+            method=responses.DELETE,
+            url=tags_url,
+            status=204,
+        )
+        yield rsps
+
+
+def test_get_tag_cache_invalidated(gl, repository, resp_get_tag):
+    gl.cache_ttl = 30
+    assert repository.tags.get("v1").digest == "sha256:abc"
+    repository.tags.get("v1")
+    assert len(resp_get_tag.calls) == 1
+
+    repository.tags.delete_in_bulk(name_regex="v.+")
+    repository.tags.get("v1")
+    assert len(resp_get_tag.calls) == 3
+
+
+def test_delete_tags_in_bulk(repository, resp_delete_tags_in_bulk):
+    repository.tags.delete_in_bulk(name_regex="v.+", keep_n=2)
+    query = parse_qs(urlparse(resp_delete_tags_in_bulk.calls[0].request.url).query)
+    assert query["name_regex"] == ["v.+"]
+    assert query["keep_n"] == ["2"]
+
+
+def test_delete_many_tags(repository, resp_delete_tags_in_bulk):
+    repository.tags.delete_many(["v1.0", "v1.1-rc"])
+    assert len(resp_delete_tags_in_bulk.calls) == 1
+    request = resp_delete_tags_in_bulk.calls[0].request
+    query = parse_qs(urlparse(request.url).query)
+    assert query["name_regex"] == [r"(?:v1\.0|v1\.1\-rc)"]
+
+
+def test_delete_many_tags_empty(repository):
+    with responses.RequestsMock():
+        repository.tags.delete_many([])
@@ -19,9 +19,11 @@
 import pickle
 
 import pytest
+import requests
 from httmock import HTTMock, response, urlmatch, with_httmock  # noqa
 
 from gitlab import DEFAULT_URL, Gitlab, GitlabList, USER_AGENT
+from gitlab.client import POOL_CONNECTIONS, POOL_MAXSIZE
 from gitlab.v4.objects import CurrentUser
 
 localhost = "http://localhost"
@@ -121,6 +123,15 @@ def test_gitlab_pickability(gl):
     assert unpickled._objects == original_gl_objects
 
 
+def test_gitlab_pickability_drops_cache(gl):
+    gl.cache_ttl = 30
+    gl._cache_set(("/issues", 1, frozenset()), {"id": 1})
+    unpickled = pickle.loads(pickle.dumps(gl))
+    assert unpickled.cache_ttl == 30
+    assert unpickled._cache == {}
+    assert unpickled._cache_get(("/issues", 1, frozenset())) is None
+
+
 @with_httmock(resp_get_user)
 def test_gitlab_token_auth(gl, callback=None):
     gl.auth()
@@ -129,6 +140,19 @@ def test_gitlab_token_auth(gl, callback=None):
     assert isinstance(gl.user, CurrentUser)
 
 
+def test_gitlab_session_pool_size(gl):
+    for prefix in ("http://", "https://"):
+        adapter = gl.session.get_adapter(prefix)
+        assert adapter._pool_connections == POOL_CONNECTIONS
+        assert adapter._pool_maxsize == POOL_MAXSIZE
+
+
+def test_gitlab_custom_session_is_kept():
+    session = requests.Session()
+    gl = Gitlab(localhost, session=session)
+    assert gl.session is session
+
+
 def test_gitlab_default_url():
     gl = Gitlab()
     assert gl.url == DEFAULT_URL
@@ -1,7 +1,11 @@
+from urllib.parse import parse_qs
+
+import mock
 import pytest
 import requests
 from httmock import HTTMock, response, urlmatch
 
+import gitlab.client
 from gitlab import GitlabHttpError, GitlabList, GitlabParsingError, RedirectError
 
 
@@ -223,6 +227,38 @@ def test_get_request(gl):
         assert result["name"] == "project1"
 
 
+def test_get_request_with_orjson(gl, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    monkeypatch.setattr(gitlab.client, "orjson", orjson)
+    loads = mock.Mock(wraps=orjson.loads)
+    monkeypatch.setattr(orjson, "loads", loads)
+
+    @urlmatch(scheme="http", netloc="localhost", path="/api/v4/projects", method="get")
+    def resp_cont(url, request):
+        headers = {"content-type": "application/json"}
+        content = '{"name": "project1", "labels": ["foo"]}'
+        return response(200, content, headers, None, 5, request)
+
+    with HTTMock(resp_cont):
+        result = gl.http_get("/projects")
+        assert result == {"name": "project1", "labels": ["foo"]}
+    loads.assert_called_once()
+
+
+def test_get_request_without_orjson(gl, monkeypatch):
+    monkeypatch.setattr(gitlab.client, "orjson", None)
+
+    @urlmatch(scheme="http", netloc="localhost", path="/api/v4/projects", method="get")
+    def resp_cont(url, request):
+        headers = {"content-type": "application/json"}
+        content = '{"name": "project1"}'
+        return response(200, content, headers, None, 5, request)
+
+    with HTTMock(resp_cont):
+        result = gl.http_get("/projects")
+        assert result["name"] == "project1"
+
+
 def test_get_request_raw(gl):
     @urlmatch(scheme="http", netloc="localhost", path="/api/v4/projects", method="get")
     def resp_cont(url, request):
@@ -404,3 +440,38 @@ def test_delete_request_404(gl):
     with HTTMock(resp_cont):
         with pytest.raises(GitlabHttpError):
             gl.http_delete("/not_there")
+
+
+def test_list_request_all_concurrently(gl):
+    @urlmatch(scheme="http", netloc="localhost", path="/api/v4/projects", method="get")
+    def resp_cont(url, request):
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        headers = {
+            "content-type": "application/json",
+            "X-Page": page,
+            "X-Per-Page": 1,
+            "X-Total-Pages": 3,
+            "X-Total": 3,
+        }
+        if page < 3:
+            headers["X-Next-Page"] = page + 1
+        content = '[{"name": "project%d"}]' % page
+        return response(200, content, headers, None, 5, request)
+
+    with HTTMock(resp_cont):
+        result = gl.http_list("/projects", all=True, per_page=1, max_workers=2)
+    assert [item["name"] for item in result] == ["project1", "project2", "project3"]
+
+
+def test_list_request_all_concurrently_without_total_pages(gl):
+    @urlmatch(scheme="http", netloc="localhost", path="/api/v4/projects", method="get")
+    def resp_cont(url, request):
+        headers = {"content-type": "application/json"}
+        if "page=2" not in url.query:
+            headers["Link"] = '<http://localhost/api/v4/projects?page=2>; rel="next"'
+        content = '[{"name": "project%d"}]' % (2 if "page=2" in url.query else 1)
+        return response(200, content, headers, None, 5, request)
+
+    with HTTMock(resp_cont):
+        result = gl.http_list("/projects", all=True, max_workers=2)
+    assert [item["name"] for item in result] == ["project1", "project2"]